@@ -2,6 +2,13 @@
 
 import re
 from collections import Counter
+from itertools import filterfalse
+from operator import itemgetter
+
+try:  # optional: faster engine for the hot keyword pattern
+    import regex as _re
+except ImportError:
+    import re as _re
 
 
 def generate_summary(
@@ -100,59 +107,77 @@ def generate_keywords(
     max_keywords: int = 15,
 ) -> list[str]:
     """Combine terms from transcript, OCR, and metadata into a keyword list."""
-    # Collect all text
-    all_text = f"{title} {description} {transcript} {ocr_text}"
-    all_text_lower = all_text.lower()
-
-    # Tokenize and count
-    words = re.findall(r"\b[a-záàâãéèêíïóôõúüç]{4,}\b", all_text_lower)
-    counter = Counter(words)
-
-    # Remove common Portuguese stop words
-    stop_words = {
-        "para", "como", "mais", "está", "isso", "esse", "essa", "esses",
-        "essas", "aqui", "aquele", "aquela", "então", "porque", "quando",
-        "onde", "qual", "quais", "cada", "todo", "toda", "todos", "todas",
-        "muito", "muita", "muitos", "muitas", "outro", "outra", "outros",
-        "outras", "mesmo", "mesma", "ainda", "sobre", "pode", "entre",
-        "depois", "antes", "agora", "você", "vocês", "nosso", "nossa",
-        "dele", "dela", "deles", "delas", "também", "fazer", "falar",
-        "coisa", "coisas", "gente", "tinha", "seria", "sido", "sendo",
-        "vamos", "ponto", "tipo", "acho", "vezes", "parte", "forma",
-        "exemplo", "pessoas", "tempo", "anos", "hoje", "nesse", "nessa",
-        "pela", "pelo", "numa", "desse", "dessa", "algo", "assim",
-        "bem", "ter", "tem", "são", "uma", "uns", "umas",
-    }
-    for sw in stop_words:
-        counter.pop(sw, None)
+    # Tokenize each source once; OCR and title tokens are reused for boosting
+    title_words = _tokenize(title)
+    ocr_words = _tokenize(ocr_text)
+
+    # Count, skipping common Portuguese stop words
+    counter: Counter[str] = Counter()
+    sources = (title_words, _tokenize(description), _tokenize(transcript), ocr_words)
+    for words in sources:
+        counter.update(filterfalse(_STOP_WORDS.__contains__, words))
 
     # Boost OCR terms
-    ocr_words = re.findall(r"\b[a-záàâãéèêíïóôõúüç]{4,}\b", ocr_text.lower())
     for w in ocr_words:
         if w in counter:
             counter[w] += 5
 
     # Boost title terms
-    title_words = re.findall(r"\b[a-záàâãéèêíïóôõúüç]{4,}\b", title.lower())
     for w in title_words:
         if w in counter:
             counter[w] += 10
 
-    # Get top keywords
-    top = [word for word, _ in counter.most_common(max_keywords + 5)]
-
-    # Add channel name
-    result = list(dict.fromkeys(top[:max_keywords]))
-    return result
+    # Get top keywords (Counter keys are already unique)
+    return [word for word, _ in counter.most_common(max_keywords)]
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_WORD_RE = _re.compile(r"\b[a-záàâãéèêíïóôõúüç]{4,}\b")
+_SENT_SPLIT_RE = re.compile(r"[.!?\n]+")
+
+# Common Portuguese stop words excluded from keywords
+_STOP_WORDS: frozenset[str] = frozenset({
+    "para", "como", "mais", "está", "isso", "esse", "essa", "esses",
+    "essas", "aqui", "aquele", "aquela", "então", "porque", "quando",
+    "onde", "qual", "quais", "cada", "todo", "toda", "todos", "todas",
+    "muito", "muita", "muitos", "muitas", "outro", "outra", "outros",
+    "outras", "mesmo", "mesma", "ainda", "sobre", "pode", "entre",
+    "depois", "antes", "agora", "você", "vocês", "nosso", "nossa",
+    "dele", "dela", "deles", "delas", "também", "fazer", "falar",
+    "coisa", "coisas", "gente", "tinha", "seria", "sido", "sendo",
+    "vamos", "ponto", "tipo", "acho", "vezes", "parte", "forma",
+    "exemplo", "pessoas", "tempo", "anos", "hoje", "nesse", "nessa",
+    "pela", "pelo", "numa", "desse", "dessa", "algo", "assim",
+    "bem", "ter", "tem", "são", "uma", "uns", "umas",
+})
+
+# Phrases that often introduce topics, merged into a single alternation so
+# the transcript is scanned once. Each branch captures the topic span.
+_TOPIC_RE = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in (
+            r"(?:vamos falar|vamos conversar) (?:sobre|de) ([^,.!?]{5,40})",
+            r"(?:o tema|o assunto|o tópico) (?:é|de hoje é) ([^,.!?]{5,40})",
+            r"(?:primeiro ponto|segundo ponto|terceiro ponto)[:\s]+([^,.!?]{5,40})",
+            r"(?:a questão|o ponto) (?:é|aqui é) ([^,.!?]{5,40})",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase *text* and return its keyword-sized words."""
+    return _WORD_RE.findall(text.lower())
+
+
 def _split_sentences(text: str) -> list[str]:
     """Split text into sentences."""
-    raw = re.split(r"[.!?\n]+", text)
+    raw = _SENT_SPLIT_RE.split(text)
     return [s.strip() for s in raw if len(s.strip().split()) >= 5]
 
 
@@ -167,52 +192,47 @@ def _score_sentences(
 
     scored: list[tuple[str, float]] = []
     for i, sent in enumerate(sentences):
+        lower = sent.lower()
+        tokens = lower.split()
         score = 0.0
-        words = set(sent.lower().split())
 
         # Title word overlap
-        overlap = len(words & title_words)
+        overlap = len(title_words.intersection(tokens))
         score += overlap * 2.0
 
         # Name mention
         for n in name_words:
-            if n in sent.lower():
+            if n in lower:
                 score += 3.0
 
         # Prefer earlier sentences slightly
         score -= i * 0.1
 
         # Prefer medium-length sentences
-        wc = len(sent.split())
-        if 10 <= wc <= 30:
+        if 10 <= len(tokens) <= 30:
             score += 1.0
 
         scored.append((sent, score))
 
-    scored.sort(key=lambda x: x[1], reverse=True)
+    scored.sort(key=itemgetter(1), reverse=True)
     return scored
 
 
 def _extract_topic_hints(transcript: str, max_hints: int = 20) -> list[str]:
-    """Extract potential topic phrases from transcript for chapter titles."""
+    """Extract potential topic phrases from transcript for chapter titles.
+
+    Hints are returned in the order they appear in the transcript.
+    """
     if not transcript:
         return []
 
-    # Look for phrases that often introduce topics
-    patterns = [
-        r"(?:vamos falar|vamos conversar) (?:sobre|de) ([^,.!?]{5,40})",
-        r"(?:o tema|o assunto|o tópico) (?:é|de hoje é) ([^,.!?]{5,40})",
-        r"(?:primeiro ponto|segundo ponto|terceiro ponto)[:\s]+([^,.!?]{5,40})",
-        r"(?:a questão|o ponto) (?:é|aqui é) ([^,.!?]{5,40})",
-    ]
-
     hints: list[str] = []
-    for pat in patterns:
-        for m in re.finditer(pat, transcript, re.IGNORECASE):
-            hint = m.group(1).strip().capitalize()
-            if hint and hint not in hints:
-                hints.append(hint)
-            if len(hints) >= max_hints:
-                return hints
+    for m in _TOPIC_RE.finditer(transcript):
+        span = next(g for g in m.groups() if g is not None)
+        hint = span.strip().capitalize()
+        if hint and hint not in hints:
+            hints.append(hint)
+        if len(hints) >= max_hints:
+            return hints
 
     return hints
@@ -1,9 +1,12 @@
 """YouTube video data extraction using yt-dlp."""
 
 import json
+import re
 import subprocess
 import tempfile
 import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -62,14 +65,26 @@ def extract_video_data(youtube_url: str, output_dir: str | None = None) -> Video
         for ch in raw_chapters
     ]
 
-    # --- Thumbnail download ---
-    if data.thumbnail_url:
-        data.thumbnail_path = _download_thumbnail(
-            data.thumbnail_url, out_path / f"{data.video_id}_thumb.jpg"
+    # Languages with manual (non-ASR) subtitles
+    manual_sub_langs = set(meta.get("subtitles") or {})
+
+    # --- Thumbnail download and transcript extraction (independent, run
+    # concurrently so the network round-trips overlap) ---
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        thumb_future = None
+        if data.thumbnail_url:
+            thumb_future = pool.submit(
+                _download_thumbnail,
+                data.thumbnail_url,
+                out_path / f"{data.video_id}_thumb.jpg",
+            )
+        transcript_future = pool.submit(
+            _fetch_transcript, youtube_url, out_path, data.video_id, manual_sub_langs
         )
 
-    # --- Transcript extraction ---
-    data.transcript, data.asr_generated = _fetch_transcript(youtube_url, out_path)
+        if thumb_future is not None:
+            data.thumbnail_path = thumb_future.result()
+        data.transcript, data.asr_generated = transcript_future.result()
 
     return data
 
@@ -78,6 +93,13 @@ def extract_video_data(youtube_url: str, output_dir: str | None = None) -> Video
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_VTT_TAG_RE = re.compile(r"<[^>]+>")
+_VTT_HEADERS = ("WEBVTT", "Kind:", "Language:")
+
+# Subtitle languages, in order of preference
+_SUB_LANGS = ("pt", "pt-BR", "en")
+
+
 def _fetch_metadata(url: str) -> dict:
     """Run yt-dlp --dump-json and return parsed metadata."""
     cmd = [
@@ -87,9 +109,11 @@ def _fetch_metadata(url: str) -> dict:
         "--no-warnings",
         url,
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    # Keep stdout as bytes: json.loads decodes it directly
+    result = subprocess.run(cmd, capture_output=True, timeout=120)
     if result.returncode != 0:
-        raise RuntimeError(f"yt-dlp metadata failed: {result.stderr.strip()}")
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"yt-dlp metadata failed: {stderr}")
     return json.loads(result.stdout)
 
 
@@ -102,62 +126,77 @@ def _download_thumbnail(url: str, dest: Path) -> str:
         return ""
 
 
-def _fetch_transcript(url: str, out_dir: Path) -> tuple[str, bool]:
-    """Try to fetch subtitles; fall back to auto-generated (ASR).
+def _fetch_transcript(
+    url: str, out_dir: Path, video_id: str, manual_langs: set[str]
+) -> tuple[str, bool]:
+    """Fetch subtitles in one yt-dlp run, preferring manual over ASR.
+
+    yt-dlp writes a manual subtitle for a language when one exists and the
+    auto-generated one otherwise; *manual_langs* (from the metadata) tells
+    the two apart since both use the same file name.
 
     Returns (transcript_text, asr_generated).
     """
-    # Try manual subtitles first, then auto-generated
-    for write_flag, asr in [("--write-subs", False), ("--write-auto-subs", True)]:
-        cmd = [
-            "yt-dlp",
-            write_flag,
-            "--sub-langs", "pt,pt-BR,en",
-            "--sub-format", "vtt",
-            "--skip-download",
-            "--no-warnings",
-            "-o", str(out_dir / "%(id)s.%(ext)s"),
-            url,
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if result.returncode != 0:
-            continue
-
-        # Find downloaded subtitle file
-        vtt_files = sorted(out_dir.glob("*.vtt"))
-        if not vtt_files:
+    cmd = [
+        "yt-dlp",
+        "--write-subs",
+        "--write-auto-subs",
+        "--sub-langs", ",".join(_SUB_LANGS),
+        "--sub-format", "vtt",
+        "--skip-download",
+        "--no-warnings",
+        "-o", str(out_dir / "%(id)s.%(ext)s"),
+        url,
+    ]
+    # The exit code is not checked: yt-dlp fails the whole run if one
+    # language errors (e.g. HTTP 429), but the other subtitle files may
+    # already be on disk.
+    subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+
+    # Manual subtitles first, then auto-generated, each in language priority
+    for lang in sorted(_SUB_LANGS, key=lambda lang: lang not in manual_langs):
+        vtt = out_dir / f"{video_id}.{lang}.vtt"
+        if not vtt.exists():
             continue
-
-        text = _parse_vtt(vtt_files[0])
+        text = _parse_vtt(vtt)
         if text.strip():
-            return text, asr
+            return text, lang not in manual_langs
 
     return "", False
 
 
 def _parse_vtt(path: Path) -> str:
     """Parse a WebVTT file into plain text, removing timestamps and duplicates."""
-    lines: list[str] = []
+    return " ".join(_iter_vtt_lines(path))
+
+
+def _iter_vtt_lines(path: Path) -> Iterator[str]:
+    """Stream the caption lines of a VTT file, skipping consecutive repeats."""
     prev = ""
-    for raw_line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw_line.strip()
-        # Skip headers, timestamps, and blank lines
-        if (
-            not line
-            or line.startswith("WEBVTT")
-            or line.startswith("Kind:")
-            or line.startswith("Language:")
-            or "-->" in line
-            or line.isdigit()
-        ):
-            continue
-        # Remove VTT inline tags like <00:00:01.000>
-        import re
-        clean = re.sub(r"<[^>]+>", "", line)
-        if clean and clean != prev:
-            lines.append(clean)
-            prev = clean
-    return " ".join(lines)
+    with path.open(encoding="utf-8", errors="replace") as f:
+        for raw_line in f:
+            line = _clean_vtt_line(raw_line)
+            # Rolling auto-captions repeat the previous line
+            if line and line != prev:
+                yield line
+                prev = line
+
+
+def _clean_vtt_line(raw_line: str) -> str:
+    """Return the caption text of a VTT line, or "" for non-caption lines."""
+    line = raw_line.strip()
+    # Skip headers, timestamps, and blank lines
+    if (
+        not line
+        or line.startswith(_VTT_HEADERS)
+        or "-->" in line
+        or line.isdigit()
+    ):
+        return ""
+    # Remove VTT inline tags like <00:00:01.000>
+    if "<" in line:
+        return _VTT_TAG_RE.sub("", line)
+    return line
 
 
 def _format_date(raw: str) -> str:
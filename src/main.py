@@ -41,10 +41,27 @@ def main(argv: list[str] | None = None) -> None:
         help="Diretório de trabalho para assets temporários",
         default=None,
     )
+    parser.add_argument(
+        "--no-network",
+        dest="use_network",
+        action="store_false",
+        help="Não consulta o Google (validação de nomes e mini-bios)",
+    )
+    parser.add_argument(
+        "--skip-ocr",
+        dest="use_ocr",
+        action="store_false",
+        help="Não executa OCR na thumbnail",
+    )
     args = parser.parse_args(argv)
 
     try:
-        result = run_pipeline(args.youtube_url, args.work_dir)
+        result = run_pipeline(
+            args.youtube_url,
+            args.work_dir,
+            use_network=args.use_network,
+            use_ocr=args.use_ocr,
+        )
     except Exception as e:
         print(f"Erro: {e}", file=sys.stderr)
         sys.exit(1)
@@ -61,9 +78,18 @@ def main(argv: list[str] | None = None) -> None:
         print(output_text)
 
 
-def run_pipeline(youtube_url: str, work_dir: str | None = None) -> dict:
+def run_pipeline(
+    youtube_url: str,
+    work_dir: str | None = None,
+    use_network: bool = True,
+    use_ocr: bool = True,
+) -> dict:
     """Execute the full description generation pipeline.
 
+    With ``use_network=False`` no Google searches are made (names are not
+    canonised and mini-bios fall back to the default). With
+    ``use_ocr=False`` the thumbnail is not processed by Tesseract.
+
     Returns a dict with all intermediate data and the final description.
     """
     # === Step 1: Extract video data ===
@@ -71,8 +97,11 @@ def run_pipeline(youtube_url: str, work_dir: str | None = None) -> dict:
     video = extract_video_data(youtube_url, work_dir)
 
     # === Step 2: OCR on thumbnail ===
-    print("→ Processando OCR na thumbnail...", file=sys.stderr)
-    ocr_result = extract_text_from_thumbnail(video.thumbnail_path)
+    if use_ocr:
+        print("→ Processando OCR na thumbnail...", file=sys.stderr)
+        ocr_result = extract_text_from_thumbnail(video.thumbnail_path)
+    else:
+        ocr_result = {"ocr_text_full": "", "ocr_text_short": ""}
     ocr_full = ocr_result["ocr_text_full"]
     ocr_short = ocr_result["ocr_text_short"]
 
@@ -92,11 +121,12 @@ def run_pipeline(youtube_url: str, work_dir: str | None = None) -> dict:
         channel_name=video.channel,
         video_title=video.title,
         ocr_full=ocr_full,
+        use_network=use_network,
     )
 
     # Generate mini-bios
     for person in validated:
-        if not person.mini_bio:
+        if use_network and not person.mini_bio:
             person.mini_bio = generate_mini_bio(person.canonical, video.channel)
 
     participant_names = [p.canonical for p in validated]
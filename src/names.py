@@ -1,11 +1,27 @@
 """Name candidate extraction, validation and canonisation."""
 
+import functools
 import re
 import urllib.parse
 import urllib.request
 import json
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
+
+try:  # optional: faster engine for the hot name pattern
+    import regex as _re
+except ImportError:
+    import re as _re
+
+
+# A person name: 2-5 capitalised words. Shared with the OCR module.
+# Each word after the first is anchored on its leading whitespace, so the
+# pattern has no ambiguous alternation to backtrack through.
+NAME_PATTERN = _re.compile(
+    r"\b[A-ZÀ-Ü][a-zà-ü]+(?:\s+[A-ZÀ-Ü][a-zà-ü]+){1,4}\b"
+)
 
 
 @dataclass
@@ -48,6 +64,7 @@ def validate_and_canonise(
     channel_name: str,
     video_title: str,
     ocr_full: str,
+    use_network: bool = True,
 ) -> list[ValidatedName]:
     """Apply the Anti-Error Protocol to each candidate.
 
@@ -56,27 +73,42 @@ def validate_and_canonise(
       2. Complete OCR match
       3. Canonised via web search (Google)
       4. Repeated >= 2× in transcript
+
+    Criterion 3 is skipped when *use_network* is False.
     """
     validated: list[ValidatedName] = []
 
-    for name in candidates:
+    # Criterion 3 needs one web search per candidate; run them concurrently
+    if use_network:
+        with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as pool:
+            google_spellings = list(
+                pool.map(_google_canonise, candidates, repeat(channel_name))
+            )
+    else:
+        google_spellings = [None] * len(candidates)
+
+    # Lowercase the texts once; candidates are compared against them below
+    title_lower = video_title.lower()
+    ocr_lower = ocr_full.lower()
+
+    for name, google_spelling in zip(candidates, google_spellings):
+        name_lower = name.lower()
         criteria_met = 0
         best_spelling = name
         source = "extraction"
         trust = "low"
 
         # Criterion 1: present in title
-        if _fuzzy_in(name, video_title):
+        if _fuzzy_in(name_lower, title_lower):
             criteria_met += 1
 
         # Criterion 2: complete OCR match
-        if _fuzzy_in(name, ocr_full):
+        if _fuzzy_in(name_lower, ocr_lower):
             criteria_met += 1
             best_spelling = _pick_ocr_spelling(name, ocr_full) or best_spelling
             source = "ocr"
 
         # Criterion 3: Google canonisation
-        google_spelling = _google_canonise(name, channel_name)
         if google_spelling:
             criteria_met += 1
             trust = "high"
@@ -118,13 +150,38 @@ def generate_mini_bio(name: str, channel_name: str) -> str:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-_NAME_PATTERN = re.compile(r"\b(?:[A-ZÀ-Ü][a-zà-ü]+(?:\s+|$)){2,5}")
+# Concurrent web searches during validation (network-bound)
+_SEARCH_WORKERS = 8
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_SNIPPET_SENT_SPLIT_RE = re.compile(r"[.!?]")
+
+# Patterns like "é um(a) ...", "conhecido(a) por..."
+_BIO_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"é\s+(?:um(?:a)?)\s+([^.]{10,80})",
+        r"conhecido(?:a)?\s+(?:como|por)\s+([^.]{10,80})",
+    )
+]
+
+# Profession nouns; checked as plain substrings before running the regex,
+# since most snippets contain none of them.
+_PROFESSIONS = (
+    "empresário", "jornalista", "economista", "médico", "advogado",
+    "professor", "atleta", "influenciador", "apresentador", "comediante",
+    "escritor", "analista", "trader", "investidor",
+)
+_PROFESSION_RE = re.compile(
+    rf"(?:{'|'.join(_PROFESSIONS)})[a-z]*\s+([^.]{{5,60}})", re.IGNORECASE
+)
 
 
 def _extract_capitalised_sequences(text: str) -> list[str]:
     if not text:
         return []
-    return [m.strip() for m in _NAME_PATTERN.findall(text) if m.strip()]
+    return [m.strip() for m in NAME_PATTERN.findall(text) if m.strip()]
 
 
 def _deduplicate(names: list[str]) -> list[str]:
@@ -138,20 +195,18 @@ def _deduplicate(names: list[str]) -> list[str]:
     return result
 
 
-def _fuzzy_in(name: str, text: str) -> bool:
-    if not text:
+def _fuzzy_in(name_lower: str, text_lower: str) -> bool:
+    """Case-insensitive containment; both arguments must be lowercased."""
+    if not text_lower:
         return False
-    return name.lower() in text.lower()
+    return name_lower in text_lower
 
 
 def _pick_ocr_spelling(name: str, ocr_text: str) -> str | None:
     """If the OCR text contains the name, return the OCR version."""
-    lower = name.lower()
-    for line in ocr_text.splitlines():
-        if lower in line.lower():
-            # Extract the matching span
-            idx = line.lower().index(lower)
-            return line[idx : idx + len(name)]
+    match = re.compile(re.escape(name), re.IGNORECASE).search(ocr_text)
+    if match:
+        return match.group(0)
     return None
 
 
@@ -176,7 +231,20 @@ def _google_canonise(name: str, context: str) -> str | None:
 
 
 def _search_snippet(query: str) -> str:
-    """Fetch a search snippet from Google. Returns raw text or empty string."""
+    """Fetch a search snippet from Google. Returns raw text or empty string.
+
+    Results are cached per query (case-insensitively, as the search is), so
+    canonisation and mini-bio lookups for the same person share one request.
+    Failures are not cached.
+    """
+    try:
+        return _fetch_snippet(query.lower())
+    except Exception:
+        return ""
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_snippet(query: str) -> str:
     encoded = urllib.parse.quote_plus(query)
     url = f"https://www.google.com/search?q={encoded}&hl=pt-BR"
     req = urllib.request.Request(
@@ -189,35 +257,29 @@ def _search_snippet(query: str) -> str:
             "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
         },
     )
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-        # Rough extraction of visible text from snippets
-        text = re.sub(r"<[^>]+>", " ", html)
-        text = re.sub(r"\s+", " ", text)
-        return text[:2000]
-    except Exception:
-        return ""
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        html = resp.read().decode("utf-8", errors="replace")
+    # Rough extraction of visible text from snippets
+    text = _HTML_TAG_RE.sub(" ", html)
+    text = _WS_RE.sub(" ", text)
+    return text[:2000]
 
 
 def _summarise_snippet(snippet: str, max_words: int = 12) -> str:
     """Extract a short bio-like sentence from a search snippet."""
-    # Look for patterns like "é um(a) ...", "conhecido(a) por..."
-    bio_patterns = [
-        r"é\s+(?:um(?:a)?)\s+([^.]{10,80})",
-        r"conhecido(?:a)?\s+(?:como|por)\s+([^.]{10,80})",
-        r"(?:empresário|jornalista|economista|médico|advogado|professor|atleta|"
-        r"influenciador|apresentador|comediante|escritor|analista|trader|"
-        r"investidor)[a-z]*\s+([^.]{5,60})",
-    ]
-    for pat in bio_patterns:
-        m = re.search(pat, snippet, re.IGNORECASE)
+    patterns = list(_BIO_PATTERNS)
+    lower = snippet.lower()
+    if any(p in lower for p in _PROFESSIONS):
+        patterns.append(_PROFESSION_RE)
+
+    for pat in patterns:
+        m = pat.search(snippet)
         if m:
             words = m.group(0).split()[:max_words]
             return " ".join(words)
 
     # Fallback: take the first sentence-like chunk
-    sentences = re.split(r"[.!?]", snippet)
+    sentences = _SNIPPET_SENT_SPLIT_RE.split(snippet)
     for s in sentences:
         s = s.strip()
         if 8 <= len(s.split()) <= 15:
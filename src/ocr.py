@@ -4,6 +4,8 @@ import re
 import subprocess
 from pathlib import Path
 
+from .names import NAME_PATTERN
+
 
 def extract_text_from_thumbnail(image_path: str) -> dict:
     """Run OCR on a thumbnail image and return full + short text.
@@ -32,8 +34,7 @@ def extract_name_candidates_from_ocr(ocr_full: str) -> list[str]:
     if not ocr_full:
         return []
 
-    pattern = r"\b(?:[A-ZÀ-Ü][a-zà-ü]+(?:\s+|$)){2,5}"
-    matches = re.findall(pattern, ocr_full)
+    matches = NAME_PATTERN.findall(ocr_full)
     return [m.strip() for m in matches if m.strip()]
 
 
@@ -41,6 +42,9 @@ def extract_name_candidates_from_ocr(ocr_full: str) -> list[str]:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+_OCR_WHITE_RE = re.compile(r"[ \t]+")
+
+
 def _run_tesseract(image_path: str) -> str:
     """Execute tesseract and return stdout text."""
     cmd = [
@@ -65,7 +69,7 @@ def _run_tesseract(image_path: str) -> str:
 def _clean_ocr_text(raw: str) -> str:
     """Remove noise from OCR output."""
     # Collapse whitespace
-    text = re.sub(r"[ \t]+", " ", raw)
+    text = _OCR_WHITE_RE.sub(" ", raw)
     # Remove lines that are just symbols / single chars
     lines = [
         ln.strip()
@@ -1,8 +1,33 @@
 """Template renderer for the final YouTube description."""
 
+import re
+import unicodedata
+from functools import lru_cache
+
 from .content import format_timestamp
 from .names import ValidatedName
 
+# Fixed layout; optional sections are pre-rendered blocks that are either
+# empty or end with a blank line.
+_TEMPLATE = (
+    "{title} | {main_topic}\n\n"
+    "{ocr_block}"
+    "No episódio de hoje, {names} exploram {summary}\n\n"
+    "{participants_block}"
+    "Tópicos Abordados:{chapters}\n\n"
+    "{keywords_block}"
+    "{hashtags}"
+    "{asr_block}"
+)
+
+_DEFAULT_BIO = "Profissional e participante do programa"
+_ASR_NOTICE = "(Transcrição gerada automaticamente — pode conter imprecisões.)"
+
+# Anything that is not a letter or digit separates hashtag words, except
+# apostrophes, which are dropped so "d'água" stays one word
+_HASHTAG_SPLIT_RE = re.compile(r"[\W_]+")
+_APOSTROPHES = str.maketrans("", "", "'’")
+
 
 def render_description(
     title: str,
@@ -26,68 +51,49 @@ def render_description(
         Palavras-chave
         Hashtags
     """
-    lines: list[str] = []
+    ocr_block = f"OCR: {ocr_short}\n\n" if ocr_short else ""
 
-    # --- Header ---
-    lines.append(f"{title} | {main_topic}")
-    lines.append("")
+    names_str = _format_participant_names(participants)
 
-    # --- OCR ---
-    if ocr_short:
-        lines.append(f"OCR: {ocr_short}")
-        lines.append("")
+    participants_block = ""
+    if participants:
+        participants_block = "Participantes\n" + "\n".join(
+            f"• {p.canonical} — {p.mini_bio or _DEFAULT_BIO}" for p in participants
+        ) + "\n\n"
 
-    # --- Intro paragraph ---
-    names_str = _format_name_list([p.canonical for p in participants])
-    lines.append(f"No episódio de hoje, {names_str} exploram {summary}")
-    lines.append("")
+    fmt = format_timestamp  # local binding avoids a global lookup per chapter
+    chapters_block = "".join(f"\n{fmt(ch['start'])} {ch['title']}" for ch in chapters)
 
-    # --- Participants ---
-    if participants:
-        lines.append("Participantes")
-        for p in participants:
-            bio = p.mini_bio or "Profissional e participante do programa"
-            lines.append(f"• {p.canonical} — {bio}")
-        lines.append("")
-
-    # --- Chapters ---
-    lines.append("Tópicos Abordados:")
-    for ch in chapters:
-        ts = format_timestamp(ch["start"])
-        lines.append(f"{ts} {ch['title']}")
-    lines.append("")
-
-    # --- Keywords ---
-    if keywords:
-        lines.append(f"Palavras-chave: {', '.join(keywords)}")
-        lines.append("")
-
-    # --- Hashtags ---
-    hashtags = _build_hashtags(channel_name, main_topic, keywords)
-    lines.append(hashtags)
-
-    # --- ASR notice ---
-    if asr_generated:
-        lines.append("")
-        lines.append(
-            "(Transcrição gerada automaticamente — "
-            "pode conter imprecisões.)"
-        )
-
-    return "\n".join(lines)
+    keywords_block = f"Palavras-chave: {', '.join(keywords)}\n\n" if keywords else ""
+
+    asr_block = f"\n\n{_ASR_NOTICE}" if asr_generated else ""
+
+    return _TEMPLATE.format(
+        title=title,
+        main_topic=main_topic,
+        ocr_block=ocr_block,
+        names=names_str,
+        summary=summary,
+        participants_block=participants_block,
+        chapters=chapters_block,
+        keywords_block=keywords_block,
+        hashtags=_build_hashtags(channel_name, main_topic, keywords),
+        asr_block=asr_block,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _format_name_list(names: list[str]) -> str:
-    """Format a list of names with commas and 'e'."""
-    if not names:
+def _format_participant_names(participants: list[ValidatedName]) -> str:
+    """Format participant names with commas and 'e'."""
+    if not participants:
         return "os participantes"
-    if len(names) == 1:
-        return names[0]
-    return ", ".join(names[:-1]) + " e " + names[-1]
+    if len(participants) == 1:
+        return participants[0].canonical
+    head = ", ".join(p.canonical for p in participants[:-1])
+    return f"{head} e {participants[-1].canonical}"
 
 
 def _build_hashtags(
@@ -95,34 +101,42 @@ def _build_hashtags(
 ) -> str:
     """Build a hashtag line."""
     tags: list[str] = ["#Podcast"]
+    seen: set[str] = {"#Podcast"}
 
     # Channel hashtag
     channel_tag = _to_hashtag(channel)
-    if channel_tag and channel_tag not in tags:
+    if channel_tag and channel_tag not in seen:
         tags.append(channel_tag)
+        seen.add(channel_tag)
 
     # Topic hashtag
     topic_tag = _to_hashtag(topic)
-    if topic_tag and topic_tag not in tags:
+    if topic_tag and topic_tag not in seen:
         tags.append(topic_tag)
+        seen.add(topic_tag)
 
     # Keyword hashtags
     for kw in keywords:
-        tag = _to_hashtag(kw)
-        if tag and tag not in tags:
-            tags.append(tag)
         if len(tags) >= max_tags:
             break
+        tag = _to_hashtag(kw)
+        if tag and tag not in seen:
+            tags.append(tag)
+            seen.add(tag)
 
     return " ".join(tags)
 
 
+@lru_cache(maxsize=1024)
 def _to_hashtag(text: str) -> str:
     """Convert text to a #CamelCase hashtag."""
     if not text:
         return ""
-    words = text.split()
-    camel = "".join(w.capitalize() for w in words if w.isalnum() or w.isalpha())
+    # NFC keeps decomposed accents attached to their letter when splitting
+    text = unicodedata.normalize("NFC", text).translate(_APOSTROPHES)
+    # Upper-case only the first letter so acronyms like "TV" survive
+    parts = _HASHTAG_SPLIT_RE.split(text)
+    camel = "".join(p[:1].upper() + p[1:] for p in parts if p)
     if not camel:
         return ""
     return f"#{camel}"
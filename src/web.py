@@ -1,37 +1,61 @@
 """Descrição Arbitragem — Web interface using Flask."""
 
 import json
+import queue
+import secrets
 import threading
-import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 
 from .main import run_pipeline
 
 app = Flask(__name__)
 
-# In-memory job store: job_id -> {status, result, error}
-_jobs: dict[str, dict] = {}
+# The API only receives a URL; refuse anything larger before parsing it
+_MAX_BODY_BYTES = 4096
+app.config["MAX_CONTENT_LENGTH"] = _MAX_BODY_BYTES
+
+# A fixed set of daemon worker threads runs the pipelines; further jobs
+# wait in the queue. Daemon threads mean stopping the server never waits.
+_MAX_WORKERS = 4
+_job_queue: queue.Queue[tuple[Future, str]] = queue.Queue()
+
+# In-memory job store: job_id -> pipeline future. Once full, finished and
+# then queued jobs are dropped so results are not kept forever.
+_MAX_JOBS = 512
+_jobs: OrderedDict[str, Future] = OrderedDict()
+_jobs_lock = threading.Lock()
+
+
+# The index page has no template variables: render it once at startup
+with app.app_context():
+    _INDEX_HTML = render_template("index.html")
 
 
 @app.route("/")
 def index():
-    return render_template("index.html")
+    return Response(_INDEX_HTML, mimetype="text/html")
 
 
 @app.route("/api/generate", methods=["POST"])
 def api_generate():
     """Start description generation as a background job."""
+    if request.content_length and request.content_length > _MAX_BODY_BYTES:
+        return jsonify({"error": "Requisição muito grande"}), 413
     data = request.get_json(silent=True) or {}
     url = data.get("url", "").strip()
     if not url:
         return jsonify({"error": "URL é obrigatória"}), 400
 
-    job_id = uuid.uuid4().hex[:12]
-    _jobs[job_id] = {"status": "running", "result": None, "error": None}
-
-    thread = threading.Thread(target=_run_job, args=(job_id, url), daemon=True)
-    thread.start()
+    job_id = secrets.token_hex(6)
+    future: Future = Future()
+    with _jobs_lock:
+        if not _make_room():
+            return jsonify({"error": "Servidor ocupado, tente novamente"}), 503
+        _jobs[job_id] = future
+    _job_queue.put((future, url))
 
     return jsonify({"job_id": job_id})
 
@@ -39,18 +63,71 @@ def api_generate():
 @app.route("/api/status/<job_id>")
 def api_status(job_id: str):
     """Poll job status."""
-    job = _jobs.get(job_id)
-    if not job:
+    with _jobs_lock:
+        future = _jobs.get(job_id)
+    if future is None:
         return jsonify({"error": "Job não encontrado"}), 404
-    return jsonify(job)
-
-
-def _run_job(job_id: str, url: str) -> None:
+    return jsonify(_job_status(future))
+
+
+def _make_room() -> bool:
+    """Evict jobs until a new one fits; caller must hold _jobs_lock.
+
+    The oldest finished job goes first, then the oldest queued job (which
+    is cancelled). Running jobs are never evicted: returns False if the
+    store is full of them.
+    """
+    while len(_jobs) >= _MAX_JOBS:
+        victim = next((jid for jid, f in _jobs.items() if f.done()), None)
+        if victim is None:
+            for jid, f in _jobs.items():
+                # cancel() fails if a worker has just started the job
+                if not f.running() and f.cancel():
+                    victim = jid
+                    break
+        if victim is None:
+            return False
+        del _jobs[victim]
+    return True
+
+
+def _worker() -> None:
+    while True:
+        future, url = _job_queue.get()
+        try:
+            # False if the job was cancelled while queued
+            if future.set_running_or_notify_cancel():
+                _run_job(future, url)
+        finally:
+            _job_queue.task_done()
+
+
+def _run_job(future: Future, url: str) -> None:
     try:
         result = run_pipeline(url)
-        _jobs[job_id] = {"status": "done", "result": result, "error": None}
     except Exception as exc:
-        _jobs[job_id] = {"status": "error", "result": None, "error": str(exc)}
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def _job_status(future: Future) -> dict:
+    """Describe a job future as {status, result, error}."""
+    if future.running():
+        return {"status": "running", "result": None, "error": None}
+    if not future.done():
+        return {"status": "queued", "result": None, "error": None}
+    if future.cancelled():
+        return {"status": "error", "result": None, "error": "Job cancelado"}
+    exc = future.exception()
+    if exc is not None:
+        return {"status": "error", "result": None, "error": str(exc)}
+    return {"status": "done", "result": future.result(), "error": None}
+
+
+# Start the pipeline workers
+for _ in range(_MAX_WORKERS):
+    threading.Thread(target=_worker, daemon=True).start()
 
 
 def run_web(host: str = "0.0.0.0", port: int = 5000, debug: bool = False):
@@ -35,6 +35,16 @@ def test_generate_chapters_auto_segments():
     assert len(result) >= 3  # 900s / 240s = ~3.75
 
 
+def test_generate_chapters_topic_hints_in_transcript_order():
+    transcript = (
+        "O tema de hoje é inflação no Brasil. "
+        "Depois vamos falar sobre juros e crédito."
+    )
+    result = generate_chapters([], transcript, 900)
+    assert result[1]["title"] == "Inflação no brasil"
+    assert result[2]["title"] == "Juros e crédito"
+
+
 def test_generate_keywords_returns_list():
     kw = generate_keywords(
         title="Investimentos em Ações",
@@ -0,0 +1,54 @@
+"""Tests for the extractor module."""
+
+import subprocess
+
+from src import extractor
+
+VTT = """WEBVTT
+Kind: captions
+Language: {lang}
+
+00:00:00.000 --> 00:00:02.000
+legenda em {lang}
+"""
+
+
+def _mock_yt_dlp(monkeypatch, returncode=0):
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, returncode, "", "HTTP Error 429")
+
+    monkeypatch.setattr(extractor.subprocess, "run", fake_run)
+
+
+def _write_subs(out_dir, *langs):
+    for lang in langs:
+        (out_dir / f"vid.{lang}.vtt").write_text(VTT.format(lang=lang))
+
+
+def test_fetch_transcript_prefers_manual(tmp_path, monkeypatch):
+    _mock_yt_dlp(monkeypatch)
+    _write_subs(tmp_path, "pt", "en")
+    text, asr = extractor._fetch_transcript("url", tmp_path, "vid", {"en"})
+    assert text == "legenda em en"
+    assert asr is False
+
+
+def test_fetch_transcript_falls_back_to_auto(tmp_path, monkeypatch):
+    _mock_yt_dlp(monkeypatch)
+    _write_subs(tmp_path, "en", "pt")
+    text, asr = extractor._fetch_transcript("url", tmp_path, "vid", set())
+    assert text == "legenda em pt"
+    assert asr is True
+
+
+def test_fetch_transcript_uses_files_after_nonzero_exit(tmp_path, monkeypatch):
+    _mock_yt_dlp(monkeypatch, returncode=1)
+    _write_subs(tmp_path, "en", "pt")
+    text, asr = extractor._fetch_transcript("url", tmp_path, "vid", {"pt"})
+    assert text == "legenda em pt"
+    assert asr is False
+
+
+def test_fetch_transcript_no_files(tmp_path, monkeypatch):
+    _mock_yt_dlp(monkeypatch, returncode=1)
+    assert extractor._fetch_transcript("url", tmp_path, "vid", set()) == ("", False)
@@ -1,6 +1,13 @@
 """Tests for the names module."""
 
-from src.names import collect_name_candidates, ValidatedName
+from src import main as main_module
+from src import names
+from src.extractor import VideoData
+from src.names import collect_name_candidates, validate_and_canonise, ValidatedName
+
+
+def _no_network(*args, **kwargs):
+    raise AssertionError("network lookup must not run")
 
 
 def test_collect_candidates_deduplicates():
@@ -31,3 +38,50 @@ def test_collect_candidates_from_transcript_repetition():
         transcript=transcript,
     )
     assert any("Carlos Mendes" in c for c in candidates)
+
+
+def test_collect_candidates_name_before_punctuation():
+    candidates = collect_name_candidates(
+        title="Entrevista com Ana Paula Souza, economista",
+        description="",
+        ocr_names=[],
+        transcript="",
+    )
+    assert candidates == ["Ana Paula Souza"]
+
+
+def test_validate_without_network_uses_local_criteria(monkeypatch):
+    monkeypatch.setattr(names, "_google_canonise", _no_network)
+    validated = validate_and_canonise(
+        candidates=["Ana Costa", "Bruno Lima", "Carla Dias"],
+        channel_name="Canal",
+        video_title="Ana Costa no podcast",
+        ocr_full="CARLA DIAS",
+        use_network=False,
+    )
+    # Title and OCR matches still count; Bruno Lima only has the baseline
+    assert [(v.canonical, v.source) for v in validated] == [
+        ("Ana Costa", "extraction"),
+        ("CARLA DIAS", "ocr"),
+    ]
+
+
+def test_main_no_network_skip_ocr(monkeypatch, capsys):
+    video = VideoData(
+        video_id="abc",
+        title="Ana Costa | Economia",
+        channel="Canal",
+        thumbnail_path="/tmp/thumb.jpg",
+        duration=300,
+        transcript="Ana Costa explica o mercado financeiro brasileiro hoje.",
+    )
+    monkeypatch.setattr(main_module, "extract_video_data", lambda url, wd: video)
+    monkeypatch.setattr(main_module, "extract_text_from_thumbnail", _no_network)
+    monkeypatch.setattr(main_module, "generate_mini_bio", _no_network)
+    monkeypatch.setattr(names, "_google_canonise", _no_network)
+
+    main_module.main(["https://youtu.be/abc", "--no-network", "--skip-ocr"])
+
+    desc = capsys.readouterr().out
+    assert "OCR:" not in desc
+    assert "• Ana Costa — Profissional e participante do programa" in desc
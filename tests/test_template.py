@@ -65,3 +65,35 @@ def test_render_asr_notice():
         asr_generated=True,
     )
     assert "Transcrição gerada automaticamente" in desc
+
+
+def test_render_hashtags_camel_case():
+    desc = render_description(
+        title="Teste",
+        main_topic="Renda fixa",
+        ocr_short="",
+        summary="investimentos.",
+        participants=[],
+        chapters=[{"start": 0, "title": "Início"}],
+        keywords=["mercado!", "são-paulo"],
+        channel_name="Finanças TV",
+    )
+    hashtags = desc.splitlines()[-1]
+    assert hashtags == "#Podcast #FinançasTV #RendaFixa #Mercado #SãoPaulo"
+
+
+def test_render_hashtags_strip_unicode_punctuation():
+    desc = render_description(
+        title="Teste",
+        main_topic="Economia & Mercado — 2025",
+        ocr_short="",
+        summary="investimentos.",
+        participants=[],
+        chapters=[{"start": 0, "title": "Início"}],
+        keywords=["copo d'água", "gota d’água", "don't stop", "Financ\u0327as"],
+        channel_name="Canal",
+    )
+    assert desc.splitlines()[-1] == (
+        "#Podcast #Canal #EconomiaMercado2025 "
+        "#CopoDágua #GotaDágua #DontStop #Finanças"
+    )
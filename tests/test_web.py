@@ -0,0 +1,137 @@
+"""Tests for the web interface."""
+
+import threading
+import time
+
+import pytest
+
+from src import web
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(web, "_jobs", web.OrderedDict())
+    return web.app.test_client()
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Fake pipeline: blocks until released; URLs containing 'erro' fail."""
+    release = threading.Event()
+
+    def fake_run_pipeline(url):
+        release.wait(timeout=5)
+        if "erro" in url:
+            raise RuntimeError("falhou")
+        return {"description": url}
+
+    monkeypatch.setattr(web, "run_pipeline", fake_run_pipeline)
+    yield release
+
+    # Let the shared workers drain before the next test patches the pipeline
+    release.set()
+    deadline = time.monotonic() + 5
+    while web._job_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _start(client, url):
+    resp = client.post("/api/generate", json={"url": url})
+    assert resp.status_code == 200
+    return resp.get_json()["job_id"]
+
+
+def _wait_for(client, job_id, status):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        data = client.get(f"/api/status/{job_id}").get_json()
+        if data["status"] == status:
+            return data
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {status!r}")
+
+
+def test_job_runs_then_done(client, pipeline):
+    job_id = _start(client, "https://youtu.be/ok")
+    _wait_for(client, job_id, "running")
+    pipeline.set()
+    data = _wait_for(client, job_id, "done")
+    assert data["result"] == {"description": "https://youtu.be/ok"}
+    assert data["error"] is None
+
+
+def test_job_error(client, pipeline):
+    pipeline.set()
+    data = _wait_for(client, _start(client, "https://youtu.be/erro"), "error")
+    assert data["error"] == "falhou"
+    assert data["result"] is None
+
+
+def _occupy_workers(client):
+    """Start one blocking job per worker and wait until all are running."""
+    job_ids = [
+        _start(client, f"https://youtu.be/w{i}") for i in range(web._MAX_WORKERS)
+    ]
+    for job_id in job_ids:
+        _wait_for(client, job_id, "running")
+    return job_ids
+
+
+def test_job_queued_while_workers_busy(client, pipeline):
+    threads_before = threading.active_count()
+    _occupy_workers(client)
+    queued = [_start(client, f"https://youtu.be/q{i}") for i in range(20)]
+    assert all(
+        client.get(f"/api/status/{job_id}").get_json()["status"] == "queued"
+        for job_id in queued
+    )
+    # Queued jobs do not get threads of their own
+    assert threading.active_count() == threads_before
+    pipeline.set()
+    for job_id in queued:
+        _wait_for(client, job_id, "done")
+
+
+def test_unknown_job_404(client):
+    assert client.get("/api/status/inexistente").status_code == 404
+
+
+def test_oversized_body_413(client, pipeline):
+    resp = client.post("/api/generate", json={"url": "x" * web._MAX_BODY_BYTES})
+    assert resp.status_code == 413
+    assert not web._jobs
+
+
+def test_store_evicts_finished_jobs_first(client, pipeline, monkeypatch):
+    monkeypatch.setattr(web, "_MAX_JOBS", web._MAX_WORKERS + 2)
+
+    pipeline.set()
+    finished = _start(client, "https://youtu.be/feito")
+    _wait_for(client, finished, "done")
+    pipeline.clear()
+
+    running = _occupy_workers(client)
+    queued = [_start(client, f"https://youtu.be/fila{i}") for i in range(2)]
+
+    # Full store: the finished job is dropped, pending ones are kept
+    assert list(web._jobs) == [*running, *queued]
+    assert client.get(f"/api/status/{finished}").status_code == 404
+
+    # No finished job left: the oldest queued job is dropped and cancelled,
+    # running jobs stay in the store
+    oldest_queued = web._jobs[queued[0]]
+    newest = _start(client, "https://youtu.be/novo")
+    assert list(web._jobs) == [*running, queued[1], newest]
+    assert oldest_queued.cancelled()
+
+    pipeline.set()
+    _wait_for(client, newest, "done")
+
+
+def test_store_full_of_running_jobs_rejects_new_job(client, pipeline, monkeypatch):
+    monkeypatch.setattr(web, "_MAX_JOBS", web._MAX_WORKERS)
+    running = _occupy_workers(client)
+
+    resp = client.post("/api/generate", json={"url": "https://youtu.be/mais"})
+    assert resp.status_code == 503
+    assert list(web._jobs) == running